@@ -0,0 +1,398 @@
+"""
+NUMBA-JIT GRID PRIMITIVES
+=========================
+
+JIT-compiled kernels for the hottest TurboOrca primitives (gravity,
+largest-object extraction). On the tiny grids ARC uses (5x5, 10x10)
+NumPy's per-call dispatch overhead exceeds the actual compute, so these
+inlined loops win by a wide margin inside the synthesis workers.
+
+Import is optional: callers fall back to the vectorized NumPy paths when
+numba is not installed.
+"""
+
+import numpy as np
+from numba import config as _numba_config
+from numba import njit, types
+
+# Fork-safety: the solver forks worker pools (MCTS roots, submission
+# tasks) after this module is imported. If a parallel kernel ever runs
+# first, numba starts its threading layer, and with TBB (the default
+# whenever it is installed) every later fork hangs the parent at
+# interpreter shutdown. workqueue is the fork-safe layer; pinning it
+# here is inert while all kernels are serial but keeps a future
+# parallel=True kernel from re-poisoning the pools.
+_numba_config.THREADING_LAYER = 'workqueue'
+
+# Explicit signatures for the kernels hit from tight search loops:
+# compilation happens at import (not first call) and the dispatcher has
+# a fixed overload set to match against instead of specializing lazily.
+# Input grids are typed readonly so frozen arrays (e.g. from the
+# content-hash caches, which set writeable=False on shared results)
+# match too; writable arrays unify to readonly.
+_I8 = types.int64
+_GRID_RO = types.Array(_I8, 2, 'A', readonly=True)
+_GRID_U8_RO = types.Array(types.uint8, 2, 'A', readonly=True)
+_BBOX_SIG = types.UniTuple(_I8, 4)(_GRID_RO, _I8)
+_FLOOD_SIG = _I8[:, :](_GRID_RO, _I8, _I8, _I8)
+_IS_TILED_SIGS = [
+    types.boolean(_GRID_RO, _I8, _I8),
+    types.boolean(_GRID_U8_RO, _I8, _I8),
+]
+
+
+@njit(cache=True, boundscheck=False)
+def gravity_down(grid):
+    H, W = grid.shape
+    out = np.zeros_like(grid)
+    for c in range(W):
+        write = H - 1
+        for r in range(H - 1, -1, -1):
+            v = grid[r, c]
+            if v != 0:
+                out[write, c] = v
+                write -= 1
+    return out
+
+
+@njit(cache=True, boundscheck=False)
+def gravity_up(grid):
+    H, W = grid.shape
+    out = np.zeros_like(grid)
+    for c in range(W):
+        write = 0
+        for r in range(H):
+            v = grid[r, c]
+            if v != 0:
+                out[write, c] = v
+                write += 1
+    return out
+
+
+@njit(cache=True, boundscheck=False)
+def gravity_left(grid):
+    H, W = grid.shape
+    out = np.zeros_like(grid)
+    for r in range(H):
+        write = 0
+        for c in range(W):
+            v = grid[r, c]
+            if v != 0:
+                out[r, write] = v
+                write += 1
+    return out
+
+
+@njit(cache=True, boundscheck=False)
+def gravity_right(grid):
+    H, W = grid.shape
+    out = np.zeros_like(grid)
+    for r in range(H):
+        write = W - 1
+        for c in range(W - 1, -1, -1):
+            v = grid[r, c]
+            if v != 0:
+                out[r, write] = v
+                write -= 1
+    return out
+
+
+@njit(_BBOX_SIG, cache=True, boundscheck=False)
+def bbox(grid, background):
+    """Min/max row and column of non-background cells in one pass.
+
+    Returns (ymin, ymax, xmin, xmax); ymax == -1 means the grid is all
+    background.
+    """
+    H, W = grid.shape
+    ymin = H
+    ymax = -1
+    xmin = W
+    xmax = -1
+    for i in range(H):
+        for j in range(W):
+            if grid[i, j] != background:
+                if i < ymin:
+                    ymin = i
+                if i > ymax:
+                    ymax = i
+                if j < xmin:
+                    xmin = j
+                if j > xmax:
+                    xmax = j
+    return ymin, ymax, xmin, xmax
+
+
+@njit(_FLOOD_SIG, cache=True, boundscheck=False)
+def flood_fill(grid, y, x, new_color):
+    """Recolor the 4-connected region containing (y, x)."""
+    H, W = grid.shape
+    out = grid.copy()
+    old = grid[y, x]
+    if old == new_color:
+        return out
+
+    stack = np.empty((H * W, 2), dtype=np.int32)
+    top = 0
+    stack[top, 0] = y
+    stack[top, 1] = x
+    top += 1
+    out[y, x] = new_color
+
+    while top > 0:
+        top -= 1
+        cy = stack[top, 0]
+        cx = stack[top, 1]
+
+        if cy > 0 and out[cy - 1, cx] == old:
+            out[cy - 1, cx] = new_color
+            stack[top, 0] = cy - 1
+            stack[top, 1] = cx
+            top += 1
+        if cy < H - 1 and out[cy + 1, cx] == old:
+            out[cy + 1, cx] = new_color
+            stack[top, 0] = cy + 1
+            stack[top, 1] = cx
+            top += 1
+        if cx > 0 and out[cy, cx - 1] == old:
+            out[cy, cx - 1] = new_color
+            stack[top, 0] = cy
+            stack[top, 1] = cx - 1
+            top += 1
+        if cx < W - 1 and out[cy, cx + 1] == old:
+            out[cy, cx + 1] = new_color
+            stack[top, 0] = cy
+            stack[top, 1] = cx + 1
+            top += 1
+
+    return out
+
+
+@njit(_IS_TILED_SIGS, cache=True, boundscheck=False)
+def is_tiled(grid, th, tw):
+    """True if the whole grid is the (th, tw) top-left tile repeated."""
+    H, W = grid.shape
+    for i in range(H):
+        for j in range(W):
+            if grid[i, j] != grid[i % th, j % tw]:
+                return False
+    return True
+
+
+@njit(cache=True, boundscheck=False)
+def largest_object_mask(grid, background):
+    """4-connected component labeling; returns the mask of the largest object."""
+    H, W = grid.shape
+    labels = np.zeros((H, W), dtype=np.int32)
+    stack = np.empty((H * W, 2), dtype=np.int32)
+    next_label = 0
+    best_label = 0
+    best_size = 0
+
+    for r in range(H):
+        for c in range(W):
+            if grid[r, c] != background and labels[r, c] == 0:
+                next_label += 1
+                size = 0
+                top = 0
+                stack[top, 0] = r
+                stack[top, 1] = c
+                top += 1
+                labels[r, c] = next_label
+
+                while top > 0:
+                    top -= 1
+                    y = stack[top, 0]
+                    x = stack[top, 1]
+                    size += 1
+
+                    if y > 0 and grid[y - 1, x] != background and labels[y - 1, x] == 0:
+                        labels[y - 1, x] = next_label
+                        stack[top, 0] = y - 1
+                        stack[top, 1] = x
+                        top += 1
+                    if y < H - 1 and grid[y + 1, x] != background and labels[y + 1, x] == 0:
+                        labels[y + 1, x] = next_label
+                        stack[top, 0] = y + 1
+                        stack[top, 1] = x
+                        top += 1
+                    if x > 0 and grid[y, x - 1] != background and labels[y, x - 1] == 0:
+                        labels[y, x - 1] = next_label
+                        stack[top, 0] = y
+                        stack[top, 1] = x - 1
+                        top += 1
+                    if x < W - 1 and grid[y, x + 1] != background and labels[y, x + 1] == 0:
+                        labels[y, x + 1] = next_label
+                        stack[top, 0] = y
+                        stack[top, 1] = x + 1
+                        top += 1
+
+                if size > best_size:
+                    best_size = size
+                    best_label = next_label
+
+    return labels == best_label
+
+
+@njit(cache=True, boundscheck=False)
+def select_best_child(visits, values, vloss, priors, parent_visits, c):
+    """Argmax of virtual-loss UCT over one parent's SoA child arrays.
+
+    Single pass, no temporaries: the numpy formulation of the same
+    score builds four intermediate arrays per tree level, which is
+    the dominant cost when sibling counts are single-digit.
+    """
+    n = visits.shape[0]
+    logp = np.log(parent_visits if parent_visits > 1 else 1.0)
+    best = 0
+    best_score = -np.inf
+    for i in range(n):
+        v = visits[i]
+        if v == 0:
+            score = -np.inf if vloss[i] > 0 else np.inf
+        else:
+            score = (values[i] - vloss[i]) / v + c * np.sqrt(logp / v) + priors[i]
+        if score > best_score:
+            best = i
+            best_score = score
+    return best
+
+
+@njit(cache=True, boundscheck=False)
+def pack_nibbles(grid):
+    """Pack grid cells into 4-bit lanes of uint64 words, row-major.
+
+    Precondition: cell values fit in a nibble (ARC colors are 0-9).
+    Trailing lanes of the last word stay zero, so equal-sized packs of
+    equal grids are bitwise identical.
+    """
+    H, W = grid.shape
+    n = H * W
+    out = np.zeros((n + 15) // 16, dtype=np.uint64)
+    k = 0
+    for i in range(H):
+        for j in range(W):
+            out[k >> 4] |= np.uint64(grid[i, j] & 15) << np.uint64((k & 15) << 2)
+            k += 1
+    return out
+
+
+@njit(cache=True, boundscheck=False)
+def packed_matches(pa, pb, n_cells):
+    """Count equal cells between two nibble-packed grids (SWAR).
+
+    XOR lights up differing lanes; OR-folding each lane's four bits
+    into its low bit and masking leaves one flag bit per mismatched
+    cell, counted with Kernighan's trick. 16 cells per word, no bool
+    temporary.
+    """
+    lane_mask = np.uint64(0x1111111111111111)
+    mismatches = 0
+    for w in range(pa.shape[0]):
+        diff = pa[w] ^ pb[w]
+        flags = (diff | (diff >> np.uint64(1)) | (diff >> np.uint64(2))
+                 | (diff >> np.uint64(3))) & lane_mask
+        while flags:
+            mismatches += 1
+            flags &= flags - np.uint64(1)
+    return n_cells - mismatches
+
+
+@njit(cache=True, boundscheck=False)
+def grid_similarity(a, b):
+    """Fraction of equal cells between two same-shaped grids.
+
+    Fused compare-and-count loop: no bool temporary, no reduction
+    dispatch, which matters when rollouts call this thousands of times
+    on 5x5..30x30 grids.
+    """
+    H, W = a.shape
+    s = 0
+    for i in range(H):
+        for j in range(W):
+            if a[i, j] == b[i, j]:
+                s += 1
+    return s / (H * W)
+
+
+@njit(cache=True, boundscheck=False)
+def object_stats(labeled, grid, n):
+    """Per-object bbox, size and dominant color in one fused pass.
+
+    Deliberately serial: a parallel=True version ran at import via the
+    warm-up and started numba's TBB thread pool, after which any
+    fork-based ProcessPoolExecutor (MCTS root workers, the submission
+    pool) hangs the parent in native code at interpreter shutdown.
+    ARC scenes hold a handful of objects, so the prange win was
+    negligible anyway. Results land in preallocated SoA output arrays.
+    """
+    H, W = labeled.shape
+    bboxes = np.empty((n, 4), dtype=np.int32)  # ymin, ymax, xmin, xmax
+    sizes = np.zeros(n, dtype=np.int64)
+    colors = np.zeros(n, dtype=np.int64)
+
+    for k in range(n):
+        label_id = k + 1
+        ymin = H
+        ymax = -1
+        xmin = W
+        xmax = -1
+        size = 0
+        hist = np.zeros(10, dtype=np.int64)
+
+        for i in range(H):
+            for j in range(W):
+                if labeled[i, j] == label_id:
+                    size += 1
+                    if i < ymin:
+                        ymin = i
+                    if i > ymax:
+                        ymax = i
+                    if j < xmin:
+                        xmin = j
+                    if j > xmax:
+                        xmax = j
+                    v = grid[i, j]
+                    if 0 < v < 10:
+                        hist[v] += 1
+
+        best_count = 0
+        best_color = 0
+        for c in range(1, 10):
+            if hist[c] > best_count:
+                best_count = hist[c]
+                best_color = c
+
+        bboxes[k, 0] = ymin
+        bboxes[k, 1] = ymax
+        bboxes[k, 2] = xmin
+        bboxes[k, 3] = xmax
+        sizes[k] = size
+        colors[k] = best_color
+
+    return bboxes, sizes, colors
+
+
+def _warm_jit_cache():
+    """Trigger compilation at import so workers never pay it mid-search.
+
+    Only the lazily-specialized kernels need a warm-up call; bbox,
+    flood_fill and is_tiled carry explicit signatures and compile when
+    the module is imported.
+    """
+    dummy = np.zeros((3, 3), dtype=np.int64)
+    dummy[0, 0] = 1
+    gravity_down(dummy)
+    gravity_up(dummy)
+    gravity_left(dummy)
+    gravity_right(dummy)
+    largest_object_mask(dummy, 0)
+    grid_similarity(dummy, dummy)
+    packed = pack_nibbles(dummy)
+    packed_matches(packed, packed, dummy.size)
+    z = np.zeros(2)
+    select_best_child(z, z, z, z + 1.0, 1, 1.414)
+    object_stats(dummy.astype(np.int32), dummy, 1)
+
+
+_warm_jit_cache()
@@ -93,48 +93,149 @@ class FuzzySystem:
         self.inputs = {}
         self.outputs = {}
         self.rules = []
-    
+        self._compiled = False
+
     def add_input(self, var: FuzzyVariable):
         self.inputs[var.name] = var
-    
+        self._compiled = False
+
     def add_output(self, var: FuzzyVariable):
         self.outputs[var.name] = var
-    
+        self._compiled = False
+
     def add_rule(self, rule: FuzzyRule):
         self.rules.append(rule)
-    
+        self._compiled = False
+
+    def _compile(self):
+        """Flatten the rule base into contiguous SoA index arrays.
+
+        Walking FuzzyRule dicts chases a pointer per antecedent — cache
+        hostile once the rule base grows. The compiled form is four uint8
+        index arrays plus uint16 row pointers (CSR layout): a few hundred
+        bytes that stay L1-resident for the whole inference call.
+        """
+        self._in_names = list(self.inputs)
+        self._out_names = list(self.outputs)
+        self._in_set_names = [list(self.inputs[n].sets) for n in self._in_names]
+        self._out_set_names = [list(self.outputs[n].sets) for n in self._out_names]
+
+        # uint8 indices require both dimensions to stay small
+        assert len(self._in_names) <= 255 and len(self._out_names) <= 255
+        assert all(len(s) <= 255 for s in self._in_set_names + self._out_set_names)
+
+        in_idx = {n: i for i, n in enumerate(self._in_names)}
+        out_idx = {n: i for i, n in enumerate(self._out_names)}
+        in_set_idx = [{s: j for j, s in enumerate(names)} for names in self._in_set_names]
+        out_set_idx = [{s: j for j, s in enumerate(names)} for names in self._out_set_names]
+
+        ant_var, ant_set, ant_ptr = [], [], [0]
+        cons_var, cons_set, cons_ptr = [], [], [0]
+
+        for rule in self.rules:
+            for var_name, set_name in rule.antecedents.items():
+                v = in_idx[var_name]
+                ant_var.append(v)
+                ant_set.append(in_set_idx[v][set_name])
+            ant_ptr.append(len(ant_var))
+
+            for var_name, set_name in rule.consequents.items():
+                v = out_idx[var_name]
+                cons_var.append(v)
+                cons_set.append(out_set_idx[v][set_name])
+            cons_ptr.append(len(cons_var))
+
+        self._ant_var = np.array(ant_var, dtype=np.uint8)
+        self._ant_set = np.array(ant_set, dtype=np.uint8)
+        self._ant_ptr = np.array(ant_ptr, dtype=np.uint16)
+        self._cons_var = np.array(cons_var, dtype=np.uint8)
+        self._cons_set = np.array(cons_set, dtype=np.uint8)
+        self._cons_ptr = np.array(cons_ptr, dtype=np.uint16)
+
+        self._mu_shape = (len(self._in_names),
+                          max((len(s) for s in self._in_set_names), default=0))
+        self._agg_shape = (len(self._out_names),
+                           max((len(s) for s in self._out_set_names), default=0))
+
+        # 256-point membership tables per input set: fuzzification becomes
+        # one table load instead of a per-point interpolation walk. The
+        # quantization error (<0.004) is below the rule base's granularity.
+        self._lut = np.zeros(self._mu_shape + (256,), dtype=np.float32)
+        self._in_lo = np.empty(len(self._in_names), dtype=np.float32)
+        self._in_scale = np.empty(len(self._in_names), dtype=np.float32)
+        for v, var_name in enumerate(self._in_names):
+            var = self.inputs[var_name]
+            lo, hi = var.range
+            self._in_lo[v] = lo
+            self._in_scale[v] = 255.0 / (hi - lo) if hi > lo else 0.0
+            xs = np.linspace(lo, hi, 256)
+            for j, set_name in enumerate(self._in_set_names[v]):
+                fset = var.sets[set_name]
+                self._lut[v, j] = [fset.membership(x) for x in xs]
+
+        # Inverted index: flat antecedent (var, set) -> rule ids mentioning
+        # it. Lets infer skip every rule whose support died during
+        # fuzzification instead of scanning the full rule base.
+        n_in_sets = self._mu_shape[0] * self._mu_shape[1]
+        by_set = [[] for _ in range(n_in_sets)]
+        for r in range(len(self.rules)):
+            for k in range(ant_ptr[r], ant_ptr[r + 1]):
+                by_set[ant_var[k] * self._mu_shape[1] + ant_set[k]].append(r)
+        self._rules_by_antset = [np.array(ids, dtype=np.int32) for ids in by_set]
+
+        self._compiled = True
+
     def infer(self, crisp_inputs: Dict[str, float]) -> Dict[str, float]:
         """Fuzzy inference: crisp inputs → crisp outputs."""
-        
-        # Fuzzification
-        fuzzy_inputs = {}
-        for var_name, value in crisp_inputs.items():
-            if var_name in self.inputs:
-                fuzzy_inputs[var_name] = self.inputs[var_name].fuzzify(value)
-        
-        # Rule evaluation & aggregation
-        output_aggregations = {name: {} for name in self.outputs}
-        
-        for rule in self.rules:
-            activation = rule.evaluate(fuzzy_inputs)
-            
+        if not self._compiled:
+            self._compile()
+
+        # Fuzzification via the precomputed lookup tables
+        mu = np.zeros(self._mu_shape, dtype=np.float32)
+        for v, var_name in enumerate(self._in_names):
+            if var_name in crisp_inputs:
+                x = (crisp_inputs[var_name] - self._in_lo[v]) * self._in_scale[v]
+                idx = int(x + 0.5)
+                if idx < 0:
+                    idx = 0
+                elif idx > 255:
+                    idx = 255
+                mu[v] = self._lut[v, :, idx]
+
+        # Skip-fire pruning: a rule cannot fire if any of its antecedent
+        # sets has (near) zero membership, so mark those rules dead up
+        # front and only evaluate the survivors.
+        alive = np.ones(len(self.rules), dtype=bool)
+        for s in np.flatnonzero(mu.ravel() <= 1e-6):
+            dead = self._rules_by_antset[s]
+            if dead.size:
+                alive[dead] = False
+
+        # Rule evaluation (min) & aggregation (max) over the SoA arrays
+        agg = np.zeros(self._agg_shape, dtype=np.float32)
+        ant_ptr, cons_ptr = self._ant_ptr, self._cons_ptr
+
+        for r in np.flatnonzero(alive):
+            activation = 1.0
+            for k in range(ant_ptr[r], ant_ptr[r + 1]):
+                m = mu[self._ant_var[k], self._ant_set[k]]
+                if m < activation:
+                    activation = m
+
             if activation > 0:
-                for out_var, out_set in rule.consequents.items():
-                    if out_set not in output_aggregations[out_var]:
-                        output_aggregations[out_var][out_set] = []
-                    output_aggregations[out_var][out_set].append(activation)
-        
-        # Aggregate (max)
-        aggregated = {}
-        for out_var, sets_dict in output_aggregations.items():
-            aggregated[out_var] = {set_name: max(activations) 
-                                   for set_name, activations in sets_dict.items()}
-        
+                for k in range(cons_ptr[r], cons_ptr[r + 1]):
+                    v, s = self._cons_var[k], self._cons_set[k]
+                    if activation > agg[v, s]:
+                        agg[v, s] = activation
+
         # Defuzzification (centroid)
         crisp_outputs = {}
-        for out_var, memberships in aggregated.items():
+        for v, out_var in enumerate(self._out_names):
+            memberships = {set_name: float(agg[v, j])
+                           for j, set_name in enumerate(self._out_set_names[v])
+                           if agg[v, j] > 0}
             crisp_outputs[out_var] = self._defuzzify(self.outputs[out_var], memberships)
-        
+
         return crisp_outputs
     
     def _defuzzify(self, var: FuzzyVariable, memberships: Dict[str, float]) -> float:
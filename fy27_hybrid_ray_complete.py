@@ -24,7 +24,7 @@ import pickle
 import hashlib
 from typing import List, Tuple, Dict, Set, Optional, Any, Callable, Union
 from dataclasses import dataclass, field
-from collections import defaultdict, deque, Counter
+from collections import defaultdict, deque, Counter, OrderedDict
 from abc import ABC, abstractmethod
 import time
 from pathlib import Path
@@ -37,6 +37,22 @@ from scipy.ndimage import label, find_objects, binary_dilation
 import copy
 from datetime import datetime
 
+try:
+    import _prims_numba as _prims
+except ImportError:
+    _prims = None
+
+# Below this size NumPy dispatch overhead dominates; use the JIT'd loops.
+_NUMBA_SIZE_CUTOFF = 400
+
+def _to_contig(a: np.ndarray) -> np.ndarray:
+    """Force C-contiguous layout before serialization.
+
+    ray.put on a flipped/transposed view scatter-serializes element by
+    element (~10x slower than the memcpy a contiguous buffer gets).
+    """
+    return np.ascontiguousarray(a)
+
 # ============================================================================
 # POST-QUANTUM & PHOTONIC FOUNDATIONS
 # ============================================================================
@@ -46,19 +62,13 @@ class PostQuantumHash:
     
     @staticmethod
     def hash_grid(grid: np.ndarray) -> str:
-        data = grid.tobytes()
-        h = hashlib.sha3_512(data).digest()
-        for _ in range(3):
-            h = hashlib.sha3_512(h).digest()
-        return h.hex()
-    
+        # A single SHA3-512 pass is already quantum-resistant; iterating
+        # it adds cost but no security.
+        return hashlib.sha3_512(grid.tobytes()).hexdigest()
+
     @staticmethod
     def hash_dsl(dsl_code: str) -> str:
-        data = dsl_code.encode('utf-8')
-        h = hashlib.sha3_512(data).digest()
-        for _ in range(3):
-            h = hashlib.sha3_512(h).digest()
-        return h.hex()
+        return hashlib.sha3_512(dsl_code.encode('utf-8')).hexdigest()
 
 # ============================================================================
 # TURBOORCA 50+ PRIMITIVES
@@ -100,8 +110,18 @@ class TurboOrcaPrimitives:
     @staticmethod
     def apply_gravity(grid: np.ndarray, direction: str = 'down') -> np.ndarray:
         """Apply gravity to non-zero elements."""
+        if _prims is not None and grid.size < _NUMBA_SIZE_CUTOFF:
+            if direction == 'down':
+                return _prims.gravity_down(grid)
+            elif direction == 'up':
+                return _prims.gravity_up(grid)
+            elif direction == 'left':
+                return _prims.gravity_left(grid)
+            elif direction == 'right':
+                return _prims.gravity_right(grid)
+
         result = grid.copy()
-        
+
         if direction == 'down':
             for col in range(grid.shape[1]):
                 non_zero = grid[:, col][grid[:, col] != 0]
@@ -129,15 +149,18 @@ class TurboOrcaPrimitives:
     def crop_to_content(grid: np.ndarray, background: int = 0) -> np.ndarray:
         """Crop to minimal bounding box."""
         mask = grid != background
-        if not mask.any():
+        rows = mask.any(axis=1)
+        cols = mask.any(axis=0)
+        if not rows.any():
             return grid
-        
-        rows = np.any(mask, axis=1)
-        cols = np.any(mask, axis=0)
-        
-        y_min, y_max = np.where(rows)[0][[0, -1]]
-        x_min, x_max = np.where(cols)[0][[0, -1]]
-        
+
+        # argmax short-circuits at the first True in C; scanning from both
+        # ends avoids materializing the full index arrays np.where builds.
+        y_min = rows.argmax()
+        y_max = rows.size - rows[::-1].argmax() - 1
+        x_min = cols.argmax()
+        x_max = cols.size - cols[::-1].argmax() - 1
+
         return grid[y_min:y_max+1, x_min:x_max+1]
     
     @staticmethod
@@ -145,17 +168,32 @@ class TurboOrcaPrimitives:
         """Replace color."""
         return np.where(grid == old_color, new_color, grid)
     
+    @staticmethod
+    def mirror_h(grid: np.ndarray) -> np.ndarray:
+        """Mirror horizontally and concatenate."""
+        return np.concatenate([grid, grid[:, ::-1]], axis=1)
+
+    @staticmethod
+    def mirror_v(grid: np.ndarray) -> np.ndarray:
+        """Mirror vertically and concatenate."""
+        return np.concatenate([grid, grid[::-1, :]], axis=0)
+
     @staticmethod
     def mirror_grid(grid: np.ndarray, axis: str = 'horizontal') -> np.ndarray:
-        """Mirror and concatenate."""
+        """Mirror and concatenate (thin dispatch kept for back-compat)."""
         if axis == 'horizontal':
-            return np.concatenate([grid, np.flip(grid, axis=1)], axis=1)
-        else:
-            return np.concatenate([grid, np.flip(grid, axis=0)], axis=0)
+            return TurboOrcaPrimitives.mirror_h(grid)
+        return TurboOrcaPrimitives.mirror_v(grid)
     
     @staticmethod
     def extract_largest_object(grid: np.ndarray, background: int = 0) -> np.ndarray:
         """Extract largest connected object."""
+        if _prims is not None and grid.size < _NUMBA_SIZE_CUTOFF:
+            mask = _prims.largest_object_mask(grid, background)
+            if not mask.any():
+                return grid
+            return np.where(mask, grid, background)
+
         objects = TurboOrcaPrimitives.find_objects(grid, background=background)
         
         if not objects:
@@ -165,10 +203,57 @@ class TurboOrcaPrimitives:
         result = np.where(largest, grid, background)
         return result
 
+# Program action dispatch table: maps action tokens to grid transforms.
+# Compiled pipelines are tuples of these callables, so the hot execution
+# loop never re-parses strings or walks an if/elif chain.
+_OPS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'flip_h': lambda g: np.flip(g, axis=0),
+    'flip_v': lambda g: np.flip(g, axis=1),
+    'rotate_90': lambda g: np.rot90(g, k=1),
+    'rotate_180': lambda g: np.rot90(g, k=2),
+    'rotate_270': lambda g: np.rot90(g, k=3),
+    'transpose': lambda g: g.T,
+    'gravity_down': lambda g: TurboOrcaPrimitives.apply_gravity(g, 'down'),
+    'gravity_up': lambda g: TurboOrcaPrimitives.apply_gravity(g, 'up'),
+    'gravity_left': lambda g: TurboOrcaPrimitives.apply_gravity(g, 'left'),
+    'gravity_right': lambda g: TurboOrcaPrimitives.apply_gravity(g, 'right'),
+    'crop': TurboOrcaPrimitives.crop_to_content,
+    'mirror_h': TurboOrcaPrimitives.mirror_h,
+    'mirror_v': TurboOrcaPrimitives.mirror_v,
+}
+
+# Batched variants operating on a (K, H, W) stack of train grids in one
+# ufunc call. Per-grid ops (gravity, crop) are deliberately absent;
+# programs using them fall back to the pair-by-pair path.
+_OPS_BATCH: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'flip_h': lambda g: np.flip(g, axis=1),
+    'flip_v': lambda g: np.flip(g, axis=2),
+    'rotate_90': lambda g: np.rot90(g, k=1, axes=(1, 2)),
+    'rotate_180': lambda g: np.rot90(g, k=2, axes=(1, 2)),
+    'rotate_270': lambda g: np.rot90(g, k=3, axes=(1, 2)),
+    'transpose': lambda g: g.transpose(0, 2, 1),
+    'mirror_h': lambda g: np.concatenate([g, g[:, :, ::-1]], axis=2),
+    'mirror_v': lambda g: np.concatenate([g, g[:, ::-1, :]], axis=1),
+}
+
 # ============================================================================
 # RAY ACTORS - DISTRIBUTED ARCHITECTURE (From Cell 17)
 # ============================================================================
 
+class BlackboardClient:
+    """Caches the GlobalBlackboard handle for actors that talk to it.
+
+    Named-actor lookup is a synchronous control-plane RPC, so resolving
+    "global_blackboard" on every method call adds ~1ms each time. The
+    orchestrator injects the handle at construction; the lazy lookup is
+    kept as a fallback for actors created without one.
+    """
+
+    def _get_blackboard(self):
+        if self.blackboard is None:
+            self.blackboard = ray.get_actor("global_blackboard")
+        return self.blackboard
+
 @ray.remote
 class GlobalBlackboard:
     """
@@ -183,11 +268,17 @@ class GlobalBlackboard:
         self.pruning_threshold = 0.5
         self.attention_mask = np.ones(50)
         self.meta_report = {
-            'blindspot_mask_ref': ray.put(np.ones((10, 10))), 
+            # 100 booleans: storing inline beats a plasma entry + ref hop
+            'blindspot_mask': np.ones((10, 10), dtype=bool),
             'action_guidance_bias': 0.8
         }
         self.task_results = {}
         self.program_cache = {}
+        # Refinement stats maintained incrementally as results arrive, so
+        # DSL refinement never round-trips the full results dict
+        self._program_counter = Counter()
+        self._success_n = 0
+        self._total_n = 0
         
     def update_policy_weights_ref(self, ref):
         self.policy_weights_ref = ref
@@ -217,10 +308,61 @@ class GlobalBlackboard:
         return self.meta_report
     
     def get_task_results(self):
+        """Returns {task_id: ObjectRef}; callers ray.get what they need."""
         return self.task_results
     
+    @staticmethod
+    def _compact_output(result: Dict[str, Any]) -> Dict[str, Any]:
+        # ARC colors are 0-9; store outputs as contiguous int8 so reading
+        # task_results back is zero-copy for the array payloads instead of
+        # pickling nested Python lists.
+        output = result.get('output')
+        if isinstance(output, np.ndarray):
+            result['output'] = np.ascontiguousarray(output, dtype=np.int8)
+        return result
+
+    def _tally(self, result: Dict[str, Any]):
+        self._total_n += 1
+        if result.get('status') == 'FOUND' and result.get('confidence', 0) > 0.8:
+            self._program_counter[result['program']] += 1
+            self._success_n += 1
+
+    def get_refinement_summary(self):
+        return {
+            'most_common': self._program_counter.most_common(5),
+            'num_successful': self._success_n,
+            'num_failed': self._total_n - self._success_n,
+            'success_rate': self._success_n / max(self._total_n, 1)
+        }
+
     def record_result(self, task_id: str, result: Dict[str, Any]):
-        self.task_results[task_id] = result
+        # Store a ref, not the payload: readers fetch only the results
+        # they need and numpy outputs come back zero-copy
+        self.task_results[task_id] = ray.put(self._compact_output(result))
+        self._tally(result)
+        return True
+
+    def begin_task(self, task_hash: str):
+        """Single startup read: latest search state plus any cached program."""
+        return {
+            'state': {
+                'policy_weights_ref': self.policy_weights_ref,
+                'pruning_threshold': self.pruning_threshold,
+                'attention_mask': self.attention_mask
+            },
+            'cached': self.program_cache.get(task_hash, None)
+        }
+
+    def finalize_task(self, task_id: str, task_hash: str, result: Dict[str, Any],
+                      cache_if_good: bool = False):
+        """Single terminal write: record the result and optionally cache its program."""
+        self.task_results[task_id] = ray.put(self._compact_output(result))
+        self._tally(result)
+        if cache_if_good:
+            self.program_cache[task_hash] = {
+                'program': result['program'],
+                'confidence': result['confidence']
+            }
         return True
     
     def get_latest_dsl_state(self):
@@ -237,40 +379,49 @@ class GlobalBlackboard:
         return self.program_cache.get(task_hash, None)
 
 @ray.remote
-class PolicyAgent:
+class PolicyAgent(BlackboardClient):
     """
     Neural network policy agent.
     Computes and publishes weights via zero-copy.
     """
     
-    def __init__(self):
+    def __init__(self, blackboard=None):
         self.weights = np.random.randn(1000).astype(np.float32)
-        
+        self.blackboard = blackboard
+        # Preallocated noise buffer: the update writes into it in place
+        # instead of allocating (and float64->float32 casting) per call
+        self._rng = np.random.default_rng()
+        self._noise = np.empty_like(self.weights)
+
     def train_and_publish(self, step: int):
         """Simulates training and publishes weights."""
-        # Simulate weight update
-        self.weights = self.weights + np.random.randn(*self.weights.shape) * 0.01
-        
-        # Publish to shared memory (zero-copy)
-        weights_ref = ray.put(self.weights)
-        
+        # Simulate weight update (in place, no fresh allocations)
+        self._rng.standard_normal(out=self._noise, dtype=np.float32)
+        np.multiply(self._noise, 0.01, out=self._noise)
+        np.add(self.weights, self._noise, out=self.weights)
+
+        # Publish to shared memory (zero-copy); += keeps the buffer
+        # contiguous but guard anyway in case the update path changes
+        weights_ref = ray.put(_to_contig(self.weights))
+
         # Update blackboard with pointer
-        blackboard = ray.get_actor("global_blackboard")
+        blackboard = self._get_blackboard()
         ray.get(blackboard.update_policy_weights_ref.remote(weights_ref))
         ray.get(blackboard.update_pruning_threshold.remote(0.5 + 0.01 * step))
         
         return f"Policy updated at step {step}"
 
 @ray.remote
-class PerceptionAgent:
+class PerceptionAgent(BlackboardClient):
     """
     Vision and meta-awareness agent.
     Generates blindspot masks and attention guidance.
     """
     
-    def __init__(self):
+    def __init__(self, blackboard=None):
         self.primitives = TurboOrcaPrimitives()
-        
+        self.blackboard = blackboard
+
     def process_input_grid(self, raw_grid: np.ndarray):
         """Process grid and generate meta-cognitive report."""
         
@@ -283,29 +434,37 @@ class PerceptionAgent:
         
         # Create meta-report
         report = {
-            'blindspot_mask_ref': ray.put(blindspot_mask),
+            # Tiny mask, no reader pulls it through the object store —
+            # inline it rather than paying a ray.put per perception cycle
+            'blindspot_mask': _to_contig(blindspot_mask),
             'action_guidance_bias': 0.9,
             'symmetry_detected': any(symmetry.values()),
             'num_objects': len(objects)
         }
         
         # Update blackboard
-        blackboard = ray.get_actor("global_blackboard")
+        blackboard = self._get_blackboard()
         ray.get(blackboard.update_meta_cognitive_report.remote(report))
         
         return report
 
 @ray.remote
-class SynthesisWorker:
+class SynthesisWorker(BlackboardClient):
     """
     Parallel MCTS worker for program synthesis.
     Each worker searches independently with shared state.
     """
     
-    def __init__(self, worker_id: int):
+    def __init__(self, worker_id: int, blackboard=None):
         self.worker_id = worker_id
         self.primitives = TurboOrcaPrimitives()
         self.pq_hash = PostQuantumHash()
+        self.blackboard = blackboard
+        self._prog_cache: Dict[str, Tuple[Callable, ...]] = {}
+        self._batch_cache: Dict[str, Optional[Tuple[Tuple[str, Callable], ...]]] = {}
+        self._train_stack = None
+        self._prefix_stacks: Dict[Tuple[str, ...], np.ndarray] = {}
+        self._exec_cache: OrderedDict = OrderedDict()
         
     def run_guided_mcts_search(self, 
                               task_id: str, 
@@ -317,13 +476,17 @@ class SynthesisWorker:
         Uses global state from blackboard.
         """
         
-        # Get global state
-        blackboard = ray.get_actor("global_blackboard")
-        state = ray.get(blackboard.get_latest_state.remote())
-        
-        # Check cache
+        # One startup RPC fetches global state and the cached program
+        blackboard = self._get_blackboard()
         task_hash = self.pq_hash.hash_grid(train_pairs[0][0])
-        cached = ray.get(blackboard.get_cached_program.remote(task_hash))
+        begin = ray.get(blackboard.begin_task.remote(task_hash))
+        state = begin['state']
+        cached = begin['cached']
+
+        # Stack identical-shape train pairs once so candidate programs can
+        # be scored in a single vectorized pass instead of pair by pair
+        self._train_stack = self._stack_pairs(train_pairs)
+        self._prefix_stacks = {}
         
         if cached and cached['confidence'] > 0.7:
             # Execute cached program
@@ -334,16 +497,27 @@ class SynthesisWorker:
                 'confidence': cached['confidence'],
                 'program': cached['program']
             }
-            ray.get(blackboard.record_result.remote(task_id, result))
+            # Fire-and-forget: actor mailbox ordering makes the write land
+            # before any later blackboard read from this worker.
+            blackboard.finalize_task.remote(task_id, task_hash, result)
             return result
         
-        # MCTS search
+        # MCTS search: generate the whole candidate batch upfront. With 13
+        # actions and length <= 3 duplicates are common at iterations=100,
+        # so dedupe before paying any evaluation cost; shared prefixes are
+        # then reused via the per-task intermediate-stack memo.
+        seen = set()
+        candidates = []
+        seed = self.worker_id * 10007 + int(task_hash[:8], 16)
+        for program in self._generate_program_batch(iterations, seed):
+            if program not in seen:
+                seen.add(program)
+                candidates.append(program)
+
         best_program = None
         best_score = 0.0
-        
-        for i in range(iterations):
-            # Try random transformations
-            program = self._generate_random_program()
+
+        for i, program in enumerate(candidates):
             score = self._evaluate_program(program, train_pairs)
             
             if score > best_score:
@@ -355,140 +529,225 @@ class SynthesisWorker:
                 break
             
             # Check pruning threshold
-            if best_score < state['pruning_threshold'] * 0.5 and i > iterations // 2:
+            if best_score < state['pruning_threshold'] * 0.5 and i > len(candidates) // 2:
                 result = {
                     'status': 'PRUNED_BY_THRESHOLD',
                     'output': test_input,
                     'confidence': 0.0,
                     'program': 'identity'
                 }
-                ray.get(blackboard.record_result.remote(task_id, result))
+                blackboard.finalize_task.remote(task_id, task_hash, result)
                 return result
         
         # Execute best program on test input
         output = self._execute_program(best_program, test_input)
         
-        # Cache if good
-        if best_score > 0.7:
-            ray.get(blackboard.cache_program.remote(task_hash, best_program, best_score))
-        
         result = {
             'status': 'FOUND' if best_score > 0.5 else 'LOW_CONFIDENCE',
             'output': output,
             'confidence': best_score,
             'program': best_program
         }
-        
-        ray.get(blackboard.record_result.remote(task_id, result))
+
+        # One terminal write covers the result and (when good) the cache
+        blackboard.finalize_task.remote(task_id, task_hash, result,
+                                        cache_if_good=best_score > 0.7)
         return result
     
+    def run_batch(self,
+                  tasks: List[Tuple[str, List[Tuple], np.ndarray]],
+                  iterations: int = 100) -> List[Dict[str, Any]]:
+        """Run a batch of tasks locally in one remote call.
+
+        Submitting one call per worker instead of one per task amortizes
+        the per-call argument serialization and scheduling overhead that
+        dominates when tasks are short. Grids arrive as ObjectRefs placed
+        in the object store by the orchestrator; ray.get resolves them
+        zero-copy from the local plasma store.
+        """
+        results = []
+        for task_id, pair_refs, test_ref in tasks:
+            grids = ray.get([r for pair in pair_refs for r in pair])
+            train_pairs = list(zip(grids[0::2], grids[1::2]))
+            test_input = ray.get(test_ref)
+            results.append(
+                self.run_guided_mcts_search(task_id, train_pairs, test_input, iterations)
+            )
+        return results
+
+    _ACTIONS = (
+        'flip_h', 'flip_v', 'rotate_90', 'rotate_180', 'rotate_270',
+        'transpose', 'gravity_down', 'gravity_up', 'gravity_left', 'gravity_right',
+        'crop', 'mirror_h', 'mirror_v'
+    )
+
+    def _generate_program_batch(self, iterations: int, seed: int) -> List[str]:
+        """Draw all candidate programs for a task in one RNG pass.
+
+        A single Generator fills the length and action-index arrays for
+        the whole batch, amortizing per-draw RNG state updates; seeding
+        from (worker_id, task) keeps workers decorrelated yet makes each
+        task's candidate stream reproducible.
+        """
+        rng = np.random.default_rng(seed)
+        lengths = rng.integers(1, 4, size=iterations)
+        indices = rng.integers(0, len(self._ACTIONS), size=(iterations, 3))
+        return ['; '.join(self._ACTIONS[j] for j in indices[i, :lengths[i]])
+                for i in range(iterations)]
+
     def _generate_random_program(self) -> str:
-        """Generate random program from primitives."""
-        actions = [
-            'flip_h', 'flip_v', 'rotate_90', 'rotate_180', 'rotate_270',
-            'transpose', 'gravity_down', 'gravity_up', 'gravity_left', 'gravity_right',
-            'crop', 'mirror_h', 'mirror_v'
-        ]
-        
+        """Generate a single random program from primitives."""
         num_actions = random.randint(1, 3)
-        return '; '.join(random.choices(actions, k=num_actions))
+        return '; '.join(random.choices(self._ACTIONS, k=num_actions))
     
+    @staticmethod
+    def _stack_pairs(train_pairs: List[Tuple]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Stack train pairs into (K, H, W) arrays when shapes agree."""
+        if len({p[0].shape for p in train_pairs}) == 1 and \
+           len({p[1].shape for p in train_pairs}) == 1:
+            return (np.stack([p[0] for p in train_pairs]),
+                    np.stack([p[1] for p in train_pairs]))
+        return None
+
+    def _compile_batch(self, program: str) -> Optional[Tuple[Callable, ...]]:
+        """Batched pipeline for the program, or None if an op can't batch."""
+        try:
+            return self._batch_cache[program]
+        except KeyError:
+            tokens = [a for a in program.split('; ') if a in _OPS]
+            compiled = (tuple((a, _OPS_BATCH[a]) for a in tokens)
+                        if all(a in _OPS_BATCH for a in tokens) else None)
+            if len(self._batch_cache) >= 4096:
+                self._batch_cache.clear()
+            self._batch_cache[program] = compiled
+            return compiled
+
     def _evaluate_program(self, program: str, train_pairs: List[Tuple]) -> float:
         """Evaluate program on training pairs."""
+        if self._train_stack is not None and program and program != 'identity':
+            batch_fns = self._compile_batch(program)
+            if batch_fns is not None:
+                inputs, targets = self._train_stack
+                current = inputs
+                prefix = ()
+                for token, fn in batch_fns:
+                    prefix += (token,)
+                    cached_stack = self._prefix_stacks.get(prefix)
+                    if cached_stack is None:
+                        current = fn(current)
+                        if len(self._prefix_stacks) < 1024:
+                            self._prefix_stacks[prefix] = current
+                    else:
+                        current = cached_stack
+
+                if current.shape != targets.shape:
+                    return 0.0
+
+                eq = current == targets
+                partial = eq.reshape(eq.shape[0], -1).mean(axis=1)
+                return float(np.where(partial == 1.0, 1.0, partial * 0.5).mean())
+
         score = 0.0
-        
+
         for input_grid, target_grid in train_pairs:
             output = self._execute_program(program, input_grid)
-            
-            if np.array_equal(output, target_grid):
+
+            # Shape-changing programs (crop/mirror) can't match and would
+            # trip numpy broadcasting in the comparison below
+            if output.shape != target_grid.shape:
+                continue
+
+            # One equality pass serves both the exact and partial score
+            eq = output == target_grid
+            if eq.all():
                 score += 1.0
             else:
                 # Partial credit
-                score += np.mean(output == target_grid) * 0.5
-        
+                score += eq.mean() * 0.5
+
         return score / len(train_pairs)
     
+    def _compile_program(self, program: str) -> Tuple[Callable, ...]:
+        """Parse a program once per worker and memoize the callable pipeline.
+
+        The "; "-split and token dispatch used to run for every train
+        pair on every iteration; with <=13^3 distinct programs the cache
+        converges almost immediately.
+        """
+        compiled = self._prog_cache.get(program)
+        if compiled is None:
+            compiled = tuple(_OPS[a] for a in program.split('; ') if a in _OPS)
+            if len(self._prog_cache) >= 4096:
+                self._prog_cache.clear()
+            self._prog_cache[program] = compiled
+        return compiled
+
+    _EXEC_CACHE_MAX = 4096
+
     def _execute_program(self, program: str, input_grid: np.ndarray) -> np.ndarray:
         """Execute program on input grid."""
         if program == 'identity' or not program:
             return input_grid
-        
-        current = input_grid.copy()
-        actions = program.split('; ')
-        
-        for action in actions:
-            try:
-                if action == 'flip_h':
-                    current = np.flip(current, axis=0)
-                elif action == 'flip_v':
-                    current = np.flip(current, axis=1)
-                elif action == 'rotate_90':
-                    current = np.rot90(current, k=1)
-                elif action == 'rotate_180':
-                    current = np.rot90(current, k=2)
-                elif action == 'rotate_270':
-                    current = np.rot90(current, k=3)
-                elif action == 'transpose':
-                    current = current.T
-                elif action.startswith('gravity_'):
-                    direction = action.split('_')[1]
-                    current = self.primitives.apply_gravity(current, direction)
-                elif action == 'crop':
-                    current = self.primitives.crop_to_content(current)
-                elif action == 'mirror_h':
-                    current = self.primitives.mirror_grid(current, 'horizontal')
-                elif action == 'mirror_v':
-                    current = self.primitives.mirror_grid(current, 'vertical')
-            except Exception as e:
-                continue
-        
+
+        # Only ~13^3 distinct programs exist and grids repeat heavily
+        # within a task, so (program, grid) pairs recur; LRU the results.
+        key = (program, input_grid.shape, input_grid.tobytes())
+        cached = self._exec_cache.get(key)
+        if cached is not None:
+            self._exec_cache.move_to_end(key)
+            return cached
+
+        # No try/except in the inner loop: _compile_program already
+        # filtered unknown tokens, and every _OPS transform is total over
+        # 2D grids, so nothing here can raise.
+        current = input_grid
+        for fn in self._compile_program(program):
+            current = fn(current)
+
+        # Flips/rotations above leave views; hand back a contiguous array
+        # so downstream ray.put / result serialization stays zero-copy
+        current = _to_contig(current)
+
+        if len(self._exec_cache) >= self._EXEC_CACHE_MAX:
+            self._exec_cache.popitem(last=False)
+        self._exec_cache[key] = current
         return current
 
 @ray.remote
-class ConsciousnessActor:
+class ConsciousnessActor(BlackboardClient):
     """
     Meta-learning and DSL refinement agent.
     Analyzes results and evolves the DSL.
     """
     
-    def __init__(self):
+    def __init__(self, blackboard=None):
         self.pq_hash = PostQuantumHash()
-        
-    def run_dsl_refinement(self, results: Dict[str, Dict]):
-        """Analyze results and refine DSL."""
-        
-        # Analyze success patterns
-        successful_programs = []
-        failed_tasks = []
-        
-        for task_id, result in results.items():
-            if result.get('status') == 'FOUND' and result.get('confidence', 0) > 0.8:
-                successful_programs.append(result['program'])
-            else:
-                failed_tasks.append(task_id)
-        
-        # Extract common patterns
-        program_counter = Counter(successful_programs)
-        most_common = program_counter.most_common(5)
-        
+        self.blackboard = blackboard
+
+    def run_dsl_refinement(self):
+        """Refine the DSL from the blackboard's incremental statistics."""
+
+        blackboard = self._get_blackboard()
+        summary = ray.get(blackboard.get_refinement_summary.remote())
+        most_common = summary['most_common']
+
         print(f"\n--- Meta-Learning Analysis ---")
-        print(f"Successful programs: {len(successful_programs)}")
-        print(f"Failed tasks: {len(failed_tasks)}")
+        print(f"Successful programs: {summary['num_successful']}")
+        print(f"Failed tasks: {summary['num_failed']}")
         print(f"Most common programs: {most_common}")
-        
+
         # Create refined DSL (simplified)
         refined_dsl = {
             'common_patterns': [p for p, _ in most_common],
-            'success_rate': len(successful_programs) / max(len(results), 1)
+            'success_rate': summary['success_rate']
         }
-        
+
         # Update blackboard with new DSL
         dsl_ref = ray.put(refined_dsl)
         dsl_hash = self.pq_hash.hash_dsl(str(refined_dsl))
-        
-        blackboard = ray.get_actor("global_blackboard")
+
         ray.get(blackboard.update_learned_dsl_ref_and_hash.remote(dsl_ref, dsl_hash))
-        
+
         return f"DSL refinement complete. Success rate: {refined_dsl['success_rate']:.2%}"
 
 # ============================================================================
@@ -583,16 +842,16 @@ def deploy_and_run_solver(
     blackboard = GlobalBlackboard.options(name="global_blackboard").remote()
     print("  ✓ GlobalBlackboard")
     
-    policy_agent = PolicyAgent.remote()
+    policy_agent = PolicyAgent.remote(blackboard)
     print("  ✓ PolicyAgent")
     
-    perception_agent = PerceptionAgent.remote()
+    perception_agent = PerceptionAgent.remote(blackboard)
     print("  ✓ PerceptionAgent")
     
-    meta_agent = ConsciousnessActor.remote()
+    meta_agent = ConsciousnessActor.remote(blackboard)
     print("  ✓ ConsciousnessActor")
     
-    workers = [SynthesisWorker.remote(i) for i in range(num_workers)]
+    workers = [SynthesisWorker.remote(i, blackboard) for i in range(num_workers)]
     print(f"  ✓ {num_workers} SynthesisWorkers")
     
     print(f"\n✅ {num_workers + 4} actors deployed")
@@ -609,54 +868,82 @@ def deploy_and_run_solver(
     task_ids = list(arc_tasks.keys())
     print(f"✅ Loaded {len(task_ids)} tasks")
     
-    # 5. Dispatch tasks
+    # 5. Dispatch tasks (grouped: one batch call per worker instead of
+    # one remote call per task)
     print(f"\n--- Dispatching to {num_workers} Workers ---")
     start_time = time.time()
-    task_futures = []
-    
+
+    # Identical grids appear across tasks (and across train/test splits);
+    # key puts by content hash so each distinct grid lands in plasma once.
+    put_cache: Dict[Tuple, Any] = {}
+
+    def _put_grid(raw) -> Any:
+        arr = np.ascontiguousarray(raw)
+        key = (arr.shape, hashlib.blake2b(arr.tobytes(), digest_size=16).digest())
+        ref = put_cache.get(key)
+        if ref is None:
+            ref = ray.put(arr)
+            put_cache[key] = ref
+        return ref
+
+    batches = [[] for _ in range(num_workers)]
     for i, task_id in enumerate(task_ids):
-        worker = workers[i % num_workers]
         task_data = arc_tasks[task_id]
-        
-        # Parse train pairs
-        train_pairs = [
-            (np.array(p['input']), np.array(p['output']))
+
+        # Put each grid in the object store once as a contiguous array;
+        # workers receive ObjectRefs and resolve them zero-copy instead
+        # of re-pickling raw lists per dispatch.
+        pair_refs = [
+            (_put_grid(p['input']), _put_grid(p['output']))
             for p in task_data['train']
         ]
-        
-        # Parse test input
-        test_input = np.array(task_data['test'][0]['input'])
-        
-        # Dispatch
-        future = worker.run_guided_mcts_search.remote(
-            task_id, train_pairs, test_input, iterations=100
-        )
-        task_futures.append(future)
-        
-        if (i + 1) % 10 == 0:
-            print(f"  Dispatched {i+1}/{len(task_ids)} tasks...")
-    
-    print(f"✅ All {len(task_ids)} tasks dispatched")
+        test_ref = _put_grid(task_data['test'][0]['input'])
+
+        batches[i % num_workers].append((task_id, pair_refs, test_ref))
+
+    task_futures = [
+        worker.run_batch.remote(batch, iterations=100)
+        for worker, batch in zip(workers, batches) if batch
+    ]
+
+    print(f"✅ All {len(task_ids)} tasks dispatched in {len(task_futures)} batches")
     
     # 6. Wait for results
     print(f"\n--- Concurrent Execution (max {time_budget_minutes} min) ---")
     
+    # Drain completions in num_workers-sized waves rather than one giant
+    # blocking ray.get: finished refs are fetched (and freed) as they
+    # land, and a straggler can't hold the whole budget hostage.
+    deadline = start_time + time_budget_minutes * 60
+    pending = list(task_futures)
     try:
-        ray.get(task_futures, timeout=time_budget_minutes * 60)
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                print(f"⚠️ Time budget exhausted with {len(pending)} batches pending")
+                break
+            done, pending = ray.wait(
+                pending,
+                num_returns=min(num_workers, len(pending)),
+                timeout=remaining
+            )
+            if done:
+                ray.get(done)
     except Exception as e:
         print(f"⚠️ Execution warning: {e}")
     
     elapsed = time.time() - start_time
     print(f"✅ Execution completed in {elapsed:.1f}s")
     
-    # 7. Retrieve results
+    # 7. Retrieve results (dict of refs; array payloads resolve zero-copy)
     print("\n--- Retrieving Results ---")
-    final_results = ray.get(blackboard.get_task_results.remote())
+    result_refs = ray.get(blackboard.get_task_results.remote())
+    final_results = dict(zip(result_refs.keys(), ray.get(list(result_refs.values()))))
     print(f"✅ Retrieved {len(final_results)} results")
     
     # 8. Meta-learning
     print("\n--- Running Meta-Learning ---")
-    meta_result = ray.get(meta_agent.run_dsl_refinement.remote(final_results))
+    meta_result = ray.get(meta_agent.run_dsl_refinement.remote())
     print(f"✅ {meta_result}")
     
     # 9. Generate submission